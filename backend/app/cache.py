@@ -135,3 +135,12 @@ def cache_key_submission(submission_id: int) -> str:
     """Generate cache key for submission"""
     return f"submission:{submission_id}"
 
+
+def cache_key_user_streak(user_id: int) -> str:
+    """Generate cache key for user streak info"""
+    return f"user:streak:{user_id}"
+
+
+def cache_key_user_streak_day(user_id: int) -> str:
+    """Generate cache key for the UTC day of a user's last recorded streak update"""
+    return f"user:streak:day:{user_id}"
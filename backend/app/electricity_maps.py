@@ -20,6 +20,9 @@ REGION_TO_ZONE = {
     "world": "US",
 }
 
+# Shared session so repeated lookups reuse the TLS connection to the API
+_session = requests.Session()
+
 
 def get_live_emission_factor(region: str) -> Optional[float]:
     """
@@ -34,7 +37,7 @@ def get_live_emission_factor(region: str) -> Optional[float]:
     url = f"https://api.electricitymap.org/v3/carbon-intensity/latest?zone={zone}"
 
     try:
-        resp = requests.get(url, headers={"auth-token": api_key}, timeout=5)
+        resp = _session.get(url, headers={"auth-token": api_key}, timeout=5)
         resp.raise_for_status()
         data = resp.json()
         value = data.get("carbonIntensity")
@@ -35,7 +35,7 @@ async def lifespan(app: FastAPI):
     
     # Initialize default badges and indexes
     try:
-        db = await get_mongo_db().__anext__()
+        db = await get_mongo_db()
         await badge_service.initialize_default_badges(db)
         green_logger.logger.info("Default badges initialized")
         
@@ -82,6 +82,7 @@ def create_app() -> FastAPI:
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
         allow_headers=["*"],
         expose_headers=["X-Total-Count", "X-Page", "X-Per-Page"],
+        max_age=86400,  # let browsers cache preflights instead of repeating OPTIONS per call
     )
 
     # Request logging middleware
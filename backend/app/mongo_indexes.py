@@ -65,13 +65,25 @@ async def create_indexes(db: AsyncIOMotorDatabase):
         await submissions_collection.create_index([("created_at", DESCENDING)], background=True)
         indexes_created.append("submissions.created_at")
         
-        # Compound index for user submissions with status
+        # Compound index for user submissions with status; equality on
+        # user_id/status then a bounded created_at range, as used by the
+        # streak submission calendar
         await submissions_collection.create_index(
             [("user_id", ASCENDING), ("status", ASCENDING), ("created_at", DESCENDING)],
             background=True
         )
         indexes_created.append("submissions.user_id, status, created_at")
         
+        # Partial index over completed submissions only, for the streak
+        # submission calendar (smaller than the full compound index)
+        await submissions_collection.create_index(
+            [("user_id", ASCENDING), ("created_at", ASCENDING)],
+            partialFilterExpression={"status": "completed"},
+            name="completed_by_user_time",
+            background=True
+        )
+        indexes_created.append("submissions.user_id, created_at (completed)")
+        
         # Badges collection indexes
         badges_collection = db["badges"]
         
@@ -119,10 +131,28 @@ async def create_indexes(db: AsyncIOMotorDatabase):
             await teams_collection.create_index([("name", ASCENDING)], unique=True, background=True)
             indexes_created.append("teams.name (unique)")
         
-        # Counters collection index (for sequence generation)
-        counters_collection = db["counters"]
-        await counters_collection.create_index([("_id", ASCENDING)], unique=True, background=True)
-        indexes_created.append("counters._id (unique)")
+        # Team members collection indexes
+        team_members_collection = db["team_members"]
+        
+        # Team ID + user ID (unique membership, guards concurrent add-member
+        # inserts). Built on its own so that existing duplicate memberships
+        # only skip this index, not the ones after it.
+        try:
+            await team_members_collection.create_index(
+                [("team_id", ASCENDING), ("user_id", ASCENDING)],
+                unique=True,
+                background=True
+            )
+            indexes_created.append("team_members.team_id, user_id (unique)")
+        except Exception as e:
+            import logging
+            logging.error(
+                f"Could not create unique team_members (team_id, user_id) index; "
+                f"remove duplicate memberships and restart: {e}"
+            )
+        
+        # Counters are looked up by _id, which MongoDB always indexes uniquely;
+        # an explicit unique=True _id index spec is rejected by the server
         
         return indexes_created
         
@@ -0,0 +1,33 @@
+"""
+Compiled source-code patterns shared by the optimizer and the debug scripts.
+
+Kept free of other app imports so scripts can use them without loading the
+ML stack.
+"""
+import re
+
+# Index-based loop header: ``for i in range(len(items))`` -> groups (index, sequence).
+# Compiled once so the per-line optimizer loops skip the re module cache probe.
+RANGE_LEN_RE = re.compile(r'for\s+(\w+)\s+in\s+range\s*\(\s*len\s*\(\s*(\w+)\s*\)\s*\)')
+
+# Accumulator initialisers: ``total = 0`` and ``out = ""``.
+SUM_INIT_RE = re.compile(r'(\w+)\s*=\s*0\s*$')
+STR_INIT_RE = re.compile(r'(\w+)\s*=\s*["\']\s*["\']')
+
+# Plain loop header: ``for x in items`` -> groups (item, sequence).
+FOR_IN_RE = re.compile(r'for\s+(\w+)\s+in\s+(\w+)')
+
+# Union of the line patterns that can start a rewrite in the optimizer. One
+# search per line filters out the (usual) lines that none of them can match.
+REWRITE_CANDIDATE_RE = re.compile(
+    r'''
+      (?P<range_len> for\s+\w+\s+in\s+range\s*\(\s*len\s*\( )
+    | (?P<sum_init>  \w+\s*=\s*0\s*$ )
+    | (?P<str_init>  \w+\s*=\s*["']\s*["'] )
+    ''',
+    re.VERBOSE,
+)
+
+# Module-level HTTP helpers (``requests.get(...)`` etc.); each call opens its own
+# connection, unlike calls made through a ``requests.Session``.
+REQUESTS_CALL_RE = re.compile(r'\brequests\.(?:get|post|put|patch|delete|head|options|request)\s*\(')
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List
 from collections import defaultdict
@@ -14,7 +15,7 @@ from ..cache import (
     cache_key_leaderboard
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get("/summary")
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Optional
+import asyncio
+from collections import defaultdict
 from datetime import datetime
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.errors import DuplicateKeyError
 
 from ..mongo import get_mongo_db, get_next_sequence
 from ..schemas import User
@@ -12,6 +15,85 @@ from ..logger import green_logger
 router = APIRouter()
 
 
+async def _get_team_with_members(
+    db: AsyncIOMotorDatabase,
+    team_id: int,
+    include_projects: bool = False
+) -> Optional[dict]:
+    """
+    Load a team together with its memberships (and optionally its projects)
+    in a single aggregation. Returns None if the team does not exist.
+    """
+    pipeline = [
+        {"$match": {"id": team_id}},
+        {"$lookup": {
+            "from": "team_members",
+            "localField": "id",
+            "foreignField": "team_id",
+            "as": "members"
+        }},
+    ]
+    if include_projects:
+        pipeline.append({"$lookup": {
+            "from": "projects",
+            "localField": "id",
+            "foreignField": "team_id",
+            "as": "projects"
+        }})
+    pipeline.append({"$project": {"_id": 0, "members._id": 0, "projects._id": 0}})
+    
+    teams = await db["teams"].aggregate(pipeline).to_list(length=1)
+    return teams[0] if teams else None
+
+
+def _is_team_member(team: dict, user_id: int) -> bool:
+    """Check membership against the members loaded by _get_team_with_members"""
+    return any(m.get("user_id") == user_id for m in team["members"])
+
+
+async def _reduce_member_submissions(db: AsyncIOMotorDatabase, member_ids: List[int]):
+    """
+    Stream completed submissions of the given members and reduce them to team
+    totals and per-user [green_score_sum, co2_sum, count] accumulators, so
+    memory stays bounded by the cursor batch size.
+    """
+    totals = {"green_score": 0, "co2": 0, "energy": 0, "count": 0}
+    per_user = defaultdict(lambda: [0, 0, 0])
+    
+    cursor = db["submissions"].find(
+        {"user_id": {"$in": member_ids}, "status": "completed"},
+        {"_id": 0, "user_id": 1, "green_score": 1, "co2_emissions_g": 1, "energy_consumption_wh": 1}
+    ).batch_size(1000)
+    async for s in cursor:
+        green_score = s.get("green_score", 0) or 0
+        co2 = s.get("co2_emissions_g", 0) or 0
+        totals["green_score"] += green_score
+        totals["co2"] += co2
+        totals["energy"] += s.get("energy_consumption_wh", 0) or 0
+        totals["count"] += 1
+        
+        stats = per_user[s.get("user_id")]
+        stats[0] += green_score
+        stats[1] += co2
+        stats[2] += 1
+    
+    return totals, per_user
+
+
+def _member_stat(member: dict, user: Optional[dict], stats: List) -> dict:
+    """Build a team leaderboard entry from a member's accumulated stats"""
+    green_score_sum, co2_saved, submission_count = stats
+    avg_score = green_score_sum / submission_count if submission_count else 0
+    return {
+        "user_id": member["user_id"],
+        "username": user.get("username") if user else "Unknown",
+        "average_green_score": round(avg_score, 2),
+        "total_submissions": submission_count,
+        "total_co2_saved": round(co2_saved, 3),
+        "role": member.get("role")
+    }
+
+
 @router.post("", response_model=TeamResponse)
 async def create_team(
     team_data: TeamCreate,
@@ -149,8 +231,11 @@ async def delete_team(
         if not membership:
             raise HTTPException(status_code=403, detail="Not authorized to delete team")
     
-    await db["teams"].delete_one({"id": team_id})
-    await db["team_members"].delete_many({"team_id": team_id})
+    # Team and membership deletes are independent; issue them together
+    await asyncio.gather(
+        db["teams"].delete_one({"id": team_id}),
+        db["team_members"].delete_many({"team_id": team_id})
+    )
     
     return {"message": "Team deleted successfully"}
 
@@ -163,43 +248,42 @@ async def add_team_member(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db)
 ):
     """Add a member to a team (admin only)"""
-    team = await db["teams"].find_one({"id": team_id})
+    # Team, caller's admin membership and target user are independent lookups
+    team, is_team_admin, user = await asyncio.gather(
+        db["teams"].find_one({"id": team_id}, {"_id": 0, "created_by": 1}),
+        db["team_members"].count_documents(
+            {"team_id": team_id, "user_id": current_user.id, "role": "admin"},
+            limit=1
+        ),
+        db["users"].find_one({"email": member_data.email}, {"_id": 0, "id": 1})
+    )
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
-    # Check if current user is team admin
-    membership = await db["team_members"].find_one({
-        "team_id": team_id,
-        "user_id": current_user.id,
-        "role": "admin"
-    })
-    
-    if not membership and team.get("created_by") != current_user.id and current_user.role.value != "admin":
+    if not is_team_admin and team.get("created_by") != current_user.id and current_user.role.value != "admin":
         raise HTTPException(status_code=403, detail="Not a team admin")
     
-    # Check if user exists
-    user = await db["users"].find_one({"email": member_data.email})
     if not user:
         raise HTTPException(status_code=404, detail="User with this email not found")
     
-    # Check if already a member
-    existing = await db["team_members"].find_one({
-        "team_id": team_id,
-        "user_id": user["id"]
-    })
-    if existing:
+    # Reject existing members before allocating an id, so duplicates don't use one up
+    if await db["team_members"].count_documents(
+        {"team_id": team_id, "user_id": user["id"]}, limit=1
+    ):
         raise HTTPException(status_code=400, detail="User is already a team member")
     
-    # Add member
+    # The unique (team_id, user_id) index rejects a concurrent add that slipped past the check
     member_id = await get_next_sequence(db, "team_members")
-    team_member_doc = {
-        "id": member_id,
-        "team_id": team_id,
-        "user_id": user["id"],
-        "role": member_data.role,
-        "joined_at": datetime.utcnow()
-    }
-    await db["team_members"].insert_one(team_member_doc)
+    try:
+        await db["team_members"].insert_one({
+            "id": member_id,
+            "team_id": team_id,
+            "user_id": user["id"],
+            "role": member_data.role,
+            "joined_at": datetime.utcnow()
+        })
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="User is already a team member")
     
     green_logger.log_user_action(
         user_id=current_user.id,
@@ -218,19 +302,15 @@ async def remove_team_member(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db)
 ):
     """Remove a member from a team (admin only)"""
-    team = await db["teams"].find_one({"id": team_id})
-    if not team:
-        raise HTTPException(status_code=404, detail="Team not found")
-    
-    # Check if current user is team admin
-    membership = await db["team_members"].find_one({
-        "team_id": team_id,
-        "user_id": current_user.id,
-        "role": "admin"
-    })
-    
-    if not membership and current_user.role.value != "admin":
-        raise HTTPException(status_code=403, detail="Not a team admin")
+    # Check if current user is team admin; a missing team has no admins, so
+    # this also rejects requests for teams that do not exist
+    if current_user.role.value != "admin":
+        is_team_admin = await db["team_members"].count_documents(
+            {"team_id": team_id, "user_id": current_user.id, "role": "admin"},
+            limit=1
+        )
+        if not is_team_admin:
+            raise HTTPException(status_code=403, detail="Not a team admin")
     
     # Remove member
     result = await db["team_members"].delete_one({
@@ -251,21 +331,15 @@ async def get_team_members(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db)
 ):
     """Get all members of a team"""
-    team = await db["teams"].find_one({"id": team_id})
+    team = await _get_team_with_members(db, team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
     # Check if user is a member
-    membership = await db["team_members"].find_one({
-        "team_id": team_id,
-        "user_id": current_user.id
-    })
-    
-    if not membership and current_user.role.value != "admin":
+    if not _is_team_member(team, current_user.id) and current_user.role.value != "admin":
         raise HTTPException(status_code=403, detail="Not a team member")
     
-    members_cursor = db["team_members"].find({"team_id": team_id})
-    members = await members_cursor.to_list(length=None)
+    members = team["members"]
     
     result = []
     for m in members:
@@ -289,69 +363,36 @@ async def get_team_dashboard(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db)
 ):
     """Get team dashboard with metrics and leaderboard"""
-    team = await db["teams"].find_one({"id": team_id})
+    team = await _get_team_with_members(db, team_id, include_projects=True)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
     # Check if user is a member
-    membership = await db["team_members"].find_one({
-        "team_id": team_id,
-        "user_id": current_user.id
-    })
-    
-    if not membership and current_user.role.value != "admin":
+    if not _is_team_member(team, current_user.id) and current_user.role.value != "admin":
         raise HTTPException(status_code=403, detail="Not a team member")
     
-    # Get team members
-    team_members_cursor = db["team_members"].find({"team_id": team_id})
-    team_members = await team_members_cursor.to_list(length=None)
+    team_members = team["members"]
     member_ids = [tm["user_id"] for tm in team_members]
     
-    # Get all submissions from team members
-    submissions_cursor = db["submissions"].find({
-        "user_id": {"$in": member_ids},
-        "status": "completed"
-    })
-    submissions = await submissions_cursor.to_list(length=None)
+    # Reduce submissions from team members
+    totals, per_user = await _reduce_member_submissions(db, member_ids)
     
     # Calculate team metrics
-    total_submissions = len(submissions)
+    total_submissions = totals["count"]
     if total_submissions > 0:
-        avg_green_score = sum(s.get("green_score", 0) or 0 for s in submissions) / total_submissions
-        total_co2_saved = sum(s.get("co2_emissions_g", 0) or 0 for s in submissions)
-        total_energy_saved = sum(s.get("energy_consumption_wh", 0) or 0 for s in submissions)
+        avg_green_score = totals["green_score"] / total_submissions
     else:
         avg_green_score = 0
-        total_co2_saved = 0
-        total_energy_saved = 0
+    total_co2_saved = totals["co2"]
+    total_energy_saved = totals["energy"]
     
-    # Get team projects
-    projects_cursor = db["projects"].find({"team_id": team_id})
-    projects = await projects_cursor.to_list(length=None)
+    projects = team["projects"]
     
     # Team leaderboard (members sorted by average green score)
     member_stats = []
     for member in team_members:
-        user_submissions = [s for s in submissions if s.get("user_id") == member["user_id"]]
         user = await db["users"].find_one({"id": member["user_id"]})
-        
-        if user_submissions:
-            avg_score = sum(s.get("green_score", 0) or 0 for s in user_submissions) / len(user_submissions)
-            co2_saved = sum(s.get("co2_emissions_g", 0) or 0 for s in user_submissions)
-            submission_count = len(user_submissions)
-        else:
-            avg_score = 0
-            co2_saved = 0
-            submission_count = 0
-        
-        member_stats.append({
-            "user_id": member["user_id"],
-            "username": user.get("username") if user else "Unknown",
-            "average_green_score": round(avg_score, 2),
-            "total_submissions": submission_count,
-            "total_co2_saved": round(co2_saved, 3),
-            "role": member.get("role")
-        })
+        member_stats.append(_member_stat(member, user, per_user[member["user_id"]]))
     
     # Sort by average green score
     member_stats.sort(key=lambda x: x["average_green_score"], reverse=True)
@@ -392,54 +433,25 @@ async def get_team_leaderboard(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db)
 ):
     """Get team leaderboard"""
-    team = await db["teams"].find_one({"id": team_id})
+    team = await _get_team_with_members(db, team_id)
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
     
     # Check if user is a member
-    membership = await db["team_members"].find_one({
-        "team_id": team_id,
-        "user_id": current_user.id
-    })
-    
-    if not membership and current_user.role.value != "admin":
+    if not _is_team_member(team, current_user.id) and current_user.role.value != "admin":
         raise HTTPException(status_code=403, detail="Not a team member")
     
-    # Get team members
-    team_members_cursor = db["team_members"].find({"team_id": team_id})
-    team_members = await team_members_cursor.to_list(length=None)
+    team_members = team["members"]
     member_ids = [tm["user_id"] for tm in team_members]
     
-    # Get all submissions from team members
-    submissions_cursor = db["submissions"].find({
-        "user_id": {"$in": member_ids},
-        "status": "completed"
-    })
-    submissions = await submissions_cursor.to_list(length=None)
+    # Reduce submissions from team members
+    _, per_user = await _reduce_member_submissions(db, member_ids)
     
     # Calculate member statistics
     member_stats = []
     for member in team_members:
-        user_submissions = [s for s in submissions if s.get("user_id") == member["user_id"]]
         user = await db["users"].find_one({"id": member["user_id"]})
-        
-        if user_submissions:
-            avg_score = sum(s.get("green_score", 0) or 0 for s in user_submissions) / len(user_submissions)
-            co2_saved = sum(s.get("co2_emissions_g", 0) or 0 for s in user_submissions)
-            submission_count = len(user_submissions)
-        else:
-            avg_score = 0
-            co2_saved = 0
-            submission_count = 0
-        
-        member_stats.append({
-            "user_id": member["user_id"],
-            "username": user.get("username") if user else "Unknown",
-            "average_green_score": round(avg_score, 2),
-            "total_submissions": submission_count,
-            "total_co2_saved": round(co2_saved, 3),
-            "role": member.get("role")
-        })
+        member_stats.append(_member_stat(member, user, per_user[member["user_id"]]))
     
     # Sort by average green score
     member_stats.sort(key=lambda x: x["average_green_score"], reverse=True)
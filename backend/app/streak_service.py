@@ -1,96 +1,123 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from datetime import datetime, date, timedelta
+from datetime import datetime, timedelta
 from typing import Optional
-from .mongo import get_next_sequence
+from pymongo import ReturnDocument
+from .cache import (
+    get_cache, set_cache, delete_cache,
+    cache_key_user_streak, cache_key_user_streak_day
+)
 
 
 class StreakService:
     """Service for tracking user submission streaks"""
     
+    @staticmethod
+    def _to_datetime(value) -> Optional[datetime]:
+        """Normalize a stored date field to datetime (None if unset)"""
+        # Motor decodes BSON dates to datetime, so check that first; ISO
+        # strings only appear on legacy documents
+        if type(value) is datetime:
+            return value
+        if isinstance(value, str) and value:
+            return datetime.fromisoformat(value)
+        return None
+    
     @staticmethod
     async def update_streak(user_id: int, db: AsyncIOMotorDatabase) -> dict:
         """Update user's streak based on submission date"""
-        user = await db["users"].find_one({"id": user_id})
-        if not user:
-            return {"current_streak": 0, "longest_streak": 0}
+        now = datetime.utcnow()
+        today = now.date().isoformat()
         
-        today = date.today()
-        last_submission_date = None
-        if user.get("last_submission_date"):
-            if isinstance(user["last_submission_date"], str):
-                last_submission_date = datetime.fromisoformat(user["last_submission_date"]).date()
-            elif isinstance(user["last_submission_date"], datetime):
-                last_submission_date = user["last_submission_date"].date()
+        # Further submissions on the same UTC day cannot change the streak,
+        # so skip MongoDB entirely once today's update has been recorded
+        day_key = cache_key_user_streak_day(user_id)
+        cached = await get_cache(day_key)
+        if cached is not None and cached.get("date") == today:
+            return cached["streak"]
         
-        # If no previous submission, start streak at 1
-        if last_submission_date is None:
-            current_streak = 1
-            longest_streak = max(user.get("longest_streak", 0), 1)
-            await db["users"].update_one(
-                {"id": user_id},
-                {
-                    "$set": {
-                        "current_streak": current_streak,
-                        "longest_streak": longest_streak,
-                        "last_submission_date": datetime.utcnow()
-                    }
-                }
-            )
-        else:
-            days_diff = (today - last_submission_date).days
-            
-            if days_diff == 0:
-                # Same day submission - streak continues
-                current_streak = user.get("current_streak", 0) or 1
-                longest_streak = user.get("longest_streak", 0)
-            elif days_diff == 1:
-                # Consecutive day - increment streak
-                current_streak = (user.get("current_streak", 0) or 0) + 1
-                longest_streak = max(user.get("longest_streak", 0), current_streak)
-                await db["users"].update_one(
-                    {"id": user_id},
-                    {
-                        "$set": {
-                            "current_streak": current_streak,
-                            "longest_streak": longest_streak,
-                            "last_submission_date": datetime.utcnow()
+        # Single atomic pipeline update (MongoDB 5.0+): the day difference and
+        # the new streak values are computed server-side, so concurrent
+        # submissions cannot race between a read and a write
+        user = await db["users"].find_one_and_update(
+            {"id": user_id},
+            [
+                {"$set": {
+                    "_days_diff": {
+                        "$dateDiff": {
+                            "startDate": {"$toDate": "$last_submission_date"},
+                            "endDate": now,
+                            "unit": "day"
                         }
                     }
-                )
-            else:
-                # Streak broken - reset to 1
-                current_streak = 1
-                await db["users"].update_one(
-                    {"id": user_id},
-                    {
-                        "$set": {
-                            "current_streak": current_streak,
-                            "last_submission_date": datetime.utcnow()
+                }},
+                {"$set": {
+                    "current_streak": {
+                        "$switch": {
+                            "branches": [
+                                # Same day submission - streak continues
+                                {
+                                    "case": {"$eq": ["$_days_diff", 0]},
+                                    "then": {"$max": [{"$ifNull": ["$current_streak", 0]}, 1]}
+                                },
+                                # Consecutive day - increment streak
+                                {
+                                    "case": {"$eq": ["$_days_diff", 1]},
+                                    "then": {"$add": [{"$ifNull": ["$current_streak", 0]}, 1]}
+                                },
+                            ],
+                            # No previous submission or streak broken - reset to 1
+                            "default": 1
                         }
+                    },
+                    "last_submission_date": {
+                        "$cond": [
+                            {"$eq": ["$_days_diff", 0]},
+                            {"$toDate": "$last_submission_date"},
+                            now
+                        ]
                     }
-                )
-                longest_streak = user.get("longest_streak", 0)
+                }},
+                {"$set": {
+                    "longest_streak": {"$max": [{"$ifNull": ["$longest_streak", 0]}, "$current_streak"]}
+                }},
+                {"$unset": "_days_diff"}
+            ],
+            projection={"_id": 0, "current_streak": 1, "longest_streak": 1, "last_submission_date": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if not user:
+            return {"current_streak": 0, "longest_streak": 0}
         
-        return {
-            "current_streak": current_streak,
-            "longest_streak": longest_streak,
-            "last_submission_date": datetime.utcnow().isoformat()
+        await delete_cache(cache_key_user_streak(user_id))
+        
+        streak = {
+            "current_streak": user["current_streak"],
+            "longest_streak": user["longest_streak"],
+            # Report the persisted instant (unchanged on a same-day submission)
+            "last_submission_date": user["last_submission_date"].isoformat()
         }
+        await set_cache(day_key, {"date": today, "streak": streak}, ttl=172800)
+        
+        return streak
     
     @staticmethod
     async def get_streak_info(user_id: int, db: AsyncIOMotorDatabase) -> dict:
         """Get user's streak information"""
-        user = await db["users"].find_one({"id": user_id})
+        cache_key = cache_key_user_streak(user_id)
+        cached = await get_cache(cache_key)
+        if cached is not None:
+            return cached
+        
+        user = await db["users"].find_one(
+            {"id": user_id},
+            {"_id": 0, "current_streak": 1, "longest_streak": 1, "last_submission_date": 1}
+        )
         if not user:
             return {"current_streak": 0, "longest_streak": 0, "days_until_next": 0}
         
-        today = date.today()
-        last_submission_date = None
-        if user.get("last_submission_date"):
-            if isinstance(user["last_submission_date"], str):
-                last_submission_date = datetime.fromisoformat(user["last_submission_date"]).date()
-            elif isinstance(user["last_submission_date"], datetime):
-                last_submission_date = user["last_submission_date"].date()
+        today = datetime.utcnow().date()
+        stored_date = StreakService._to_datetime(user.get("last_submission_date"))
+        last_submission_date = stored_date.date() if stored_date else None
         
         if last_submission_date is None:
             days_until_next = 0
@@ -102,46 +129,47 @@ class StreakService:
             else:
                 days_until_next = max(0, 1 - days_diff)  # Days until streak would continue
         
-        return {
+        result = {
             "current_streak": user.get("current_streak", 0) or 0,
             "longest_streak": user.get("longest_streak", 0) or 0,
-            "last_submission_date": user.get("last_submission_date").isoformat() if user.get("last_submission_date") else None,
+            "last_submission_date": stored_date.isoformat() if last_submission_date else None,
             "days_until_next": days_until_next,
             "is_streak_active": days_diff == 0 or days_diff == 1 if last_submission_date else False
         }
+        
+        # Short TTL: dashboards poll this, and update_streak invalidates it
+        await set_cache(cache_key, result, ttl=60)
+        
+        return result
     
     @staticmethod
     async def get_submission_calendar(user_id: int, db: AsyncIOMotorDatabase, days: int = 30) -> dict:
         """Get submission calendar for the last N days"""
-        end_date = date.today()
+        end_date = datetime.utcnow().date()
         start_date = end_date - timedelta(days=days)
         
         start_datetime = datetime.combine(start_date, datetime.min.time())
         end_datetime = datetime.combine(end_date, datetime.max.time())
         
-        cursor = db["submissions"].find({
-            "user_id": user_id,
-            "status": "completed",
-            "created_at": {"$gte": start_datetime, "$lte": end_datetime}
-        })
-        
-        submissions = await cursor.to_list(length=None)
+        # Group by UTC calendar day on the server so only one row per day comes back
+        cursor = db["submissions"].aggregate([
+            {"$match": {
+                "user_id": user_id,
+                "status": "completed",
+                "created_at": {"$gte": start_datetime, "$lte": end_datetime}
+            }},
+            # Only created_at is needed; the projection trims the documents
+            # passed to $group (the scan is not guaranteed to be index-covered)
+            {"$project": {"_id": 0, "created_at": 1}},
+            {"$group": {
+                # Numeric truncation (MongoDB 5.0+) is cheaper than string formatting
+                "_id": {"$dateTrunc": {"date": "$created_at", "unit": "day"}},
+                "count": {"$sum": 1}
+            }}
+        ])
         
         # Create calendar data
-        calendar_data = {}
-        for submission in submissions:
-            sub_date = None
-            if submission.get("created_at"):
-                if isinstance(submission["created_at"], str):
-                    sub_date = datetime.fromisoformat(submission["created_at"]).date()
-                elif isinstance(submission["created_at"], datetime):
-                    sub_date = submission["created_at"].date()
-            
-            if sub_date:
-                date_str = sub_date.isoformat()
-                if date_str not in calendar_data:
-                    calendar_data[date_str] = 0
-                calendar_data[date_str] += 1
+        calendar_data = {doc["_id"].date().isoformat(): doc["count"] async for doc in cursor}
         
         return {
             "start_date": start_date.isoformat(),
@@ -5,9 +5,10 @@ Broker/backend: Redis (configured via REDIS_URL).
 """
 import os
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from pymongo import MongoClient
 
 from .config import settings
@@ -21,10 +22,46 @@ celery_app = Celery(
     backend=REDIS_URL,
 )
 
+# Analysis tasks are long and CPU-bound: hand out one task at a time so idle
+# workers are not starved, acknowledge only after completion so a crashed
+# worker's task is redelivered, and recycle children to cap ML model memory.
+celery_app.conf.update(
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    worker_max_tasks_per_child=100,
+    result_compression="gzip",
+)
+
+
+_sync_client: Optional[MongoClient] = None
+
 
 def _get_sync_db():
-    client = MongoClient(settings.mongodb_uri)
-    return client[settings.mongodb_db]
+    """
+    Get the worker's MongoDB database, creating one pooled client per process.
+    MongoClient is thread-safe, so tasks share it instead of paying the
+    connect/auth/discovery cost on every invocation.
+    """
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = MongoClient(settings.mongodb_uri, maxPoolSize=50)
+    return _sync_client[settings.mongodb_db]
+
+
+@worker_process_init.connect
+def _reset_sync_client(**kwargs):
+    # MongoClient is not fork-safe; each prefork child builds its own
+    global _sync_client
+    _sync_client = None
+
+
+@worker_process_shutdown.connect
+def _close_sync_client(**kwargs):
+    global _sync_client
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
 
 
 @celery_app.task(name="analyze_submission")
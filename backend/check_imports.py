@@ -3,6 +3,7 @@
 """Check if all imports work correctly"""
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 print("Checking imports...")
 print("=" * 50)
@@ -34,16 +35,30 @@ modules_to_check = [
     "app.main",
 ]
 
-errors = []
-for module_name in modules_to_check:
+
+def _safe_import(module_name):
+    """Import a module, returning (error, formatted traceback) on failure"""
     try:
         __import__(module_name)
-        print(f"OK: {module_name}")
+        return None, None
     except Exception as e:
-        print(f"ERROR: {module_name} - {e}")
-        errors.append((module_name, e))
-        traceback.print_exc()
-        print()
+        return e, traceback.format_exc()
+
+
+# Import in parallel so module file I/O overlaps; siblings under the same
+# package share its already-imported parent via sys.modules. Results are
+# reported in the original order.
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = list(executor.map(_safe_import, modules_to_check))
+
+errors = []
+for module_name, (error, tb) in zip(modules_to_check, results):
+    if error is None:
+        print(f"OK: {module_name}")
+    else:
+        print(f"ERROR: {module_name} - {error}")
+        errors.append((module_name, error))
+        print(tb)
 
 print("=" * 50)
 if errors:
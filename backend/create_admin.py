@@ -11,6 +11,7 @@ backend_dir = Path(__file__).resolve().parent
 sys.path.insert(0, str(backend_dir))
 
 from app.mongo import get_mongo_client, get_next_sequence
+from app.mongo_indexes import create_indexes
 from app.auth import get_password_hash
 from app.models import UserRole
 from app.config import settings
@@ -42,6 +43,10 @@ async def create_admin():
     client = get_mongo_client()
     db = client[settings.mongodb_db]
     
+    # Ensure users.email/username/id indexes exist (this script may run
+    # against a fresh database before the API has ever started)
+    await create_indexes(db)
+    
     # Check if user already exists
     existing_user = await db["users"].find_one(
         {"$or": [{"email": email.lower()}, {"username": username}]}
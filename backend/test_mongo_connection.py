@@ -32,7 +32,7 @@ async def test_connection():
         
         # Test database access
         print("3. Testing database access...")
-        db = await get_mongo_db().__anext__()
+        db = await get_mongo_db()
         print(f"   ✓ Database '{settings.mongodb_db}' accessible")
         
         # Test collection access
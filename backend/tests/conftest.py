@@ -2,10 +2,14 @@
 Pytest configuration and fixtures for Green Coding Advisor tests
 Updated for MongoDB/Motor async support
 """
+import asyncio
+import os
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport, Limits, Timeout
+from pytest_asyncio import is_async_test
 from motor.motor_asyncio import AsyncIOMotorClient
+from passlib.context import CryptContext
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -16,57 +20,107 @@ sys.path.insert(0, str(backend_dir))
 
 from app.main import create_app
 from app.mongo import get_mongo_db, get_next_sequence
+from app import auth as app_auth
 from app.auth import get_password_hash
 from app.config import settings
 from app.schemas import UserRole
 
 
-# Test MongoDB database name
-TEST_DB_NAME = "green_coding_test"
+# Test MongoDB database name; each pytest-xdist worker gets its own database
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+TEST_DB_NAME = f"green_coding_test_{_XDIST_WORKER}" if _XDIST_WORKER else "green_coding_test"
 
+# Users seeded once per session; per-test cleanup keeps them
+SEEDED_USER_EMAILS = ["test@example.com", "admin@example.com"]
 
-@pytest_asyncio.fixture(scope="function")
-async def test_db():
-    """Create a test MongoDB database for each test"""
-    # Use test database
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on the session event loop shared by the fixtures"""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Hash passwords with a single PBKDF2 round; the default cost dominates login-heavy tests"""
+    original = app_auth.pwd_context
+    app_auth.pwd_context = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__rounds=1)
+    yield
+    app_auth.pwd_context = original
+
+
+@pytest_asyncio.fixture(scope="session")
+async def mongo_client():
+    """Create one Motor client for the whole test session"""
     client = AsyncIOMotorClient(settings.mongodb_uri)
-    db = client[TEST_DB_NAME]
-    
-    # Clean up before test
-    collections = await db.list_collection_names()
-    for collection_name in collections:
-        await db[collection_name].delete_many({})
-    
+    # Start from an empty database even if a previous run was interrupted
+    await client.drop_database(TEST_DB_NAME)
     try:
-        yield db
+        yield client
     finally:
-        # Clean up after test
-        collections = await db.list_collection_names()
-        for collection_name in collections:
-            await db[collection_name].delete_many({})
+        # Drop the test database once, in a single round-trip
+        await client.drop_database(TEST_DB_NAME)
         client.close()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def client(test_db):
-    """Create a test client with MongoDB database override"""
+@pytest.fixture(scope="session")
+def session_db(mongo_client):
+    """The test MongoDB database shared by session-scoped fixtures"""
+    return mongo_client[TEST_DB_NAME]
+
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def test_db(session_db):
+    """Provide a clean test MongoDB database for each test"""
+    db = session_db
+    
+    # Clean up before test; collections (and their indexes) are kept warm.
+    # Seeded users and the id counters survive so session fixtures stay valid.
+    collections = await db.list_collection_names()
+    await asyncio.gather(*(
+        db[name].delete_many(
+            {"email": {"$nin": SEEDED_USER_EMAILS}} if name == "users" else {}
+        )
+        for name in collections
+        if name != "counters"
+    ))
+    
+    yield db
+
+
+@pytest.fixture(scope="session")
+def app(session_db):
+    """Create the application once, with the MongoDB dependency overridden"""
     app = create_app()
     
     async def override_get_mongo_db():
-        return test_db
+        return session_db
     
     app.dependency_overrides[get_mongo_db] = override_get_mongo_db
-    
-    async with AsyncClient(app=app, base_url="http://test") as test_client:
-        yield test_client
-    
+    yield app
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def test_user(test_db):
+@pytest_asyncio.fixture(scope="session")
+async def client(app):
+    """Create a test client shared by the whole session"""
+    transport = ASGITransport(app=app, raise_app_exceptions=True)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        follow_redirects=False,
+        timeout=Timeout(10.0, connect=1.0),
+        limits=Limits(max_connections=100, max_keepalive_connections=50),
+    ) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def test_user(session_db):
     """Create a test user in MongoDB"""
-    user_id = await get_next_sequence(test_db, "users")
+    user_id = await get_next_sequence(session_db, "users")
     hashed_password = get_password_hash("Test@1234")
     
     user_doc = {
@@ -82,16 +136,16 @@ async def test_user(test_db):
         "longest_streak": 0,
     }
     
-    await test_db["users"].insert_one(user_doc)
+    await session_db["users"].insert_one(user_doc)
     
     # Return user document
     return user_doc
 
 
-@pytest_asyncio.fixture
-async def test_admin(test_db):
+@pytest_asyncio.fixture(scope="session")
+async def test_admin(session_db):
     """Create a test admin user in MongoDB"""
-    user_id = await get_next_sequence(test_db, "users")
+    user_id = await get_next_sequence(session_db, "users")
     hashed_password = get_password_hash("Admin@1234")
     
     admin_doc = {
@@ -107,12 +161,12 @@ async def test_admin(test_db):
         "longest_streak": 0,
     }
     
-    await test_db["users"].insert_one(admin_doc)
+    await session_db["users"].insert_one(admin_doc)
     
     return admin_doc
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def auth_headers(client, test_user):
     """Get authentication headers for test user"""
     response = await client.post(
@@ -90,7 +90,7 @@ class TestMetricsWorkflow:
         initial_count = initial_metrics.json().get("total_submissions", 0)
         
         # Submit code
-        await client.post(
+        submit_response = await client.post(
             "/submissions",
             headers=auth_headers,
             json={
@@ -99,8 +99,18 @@ class TestMetricsWorkflow:
                 "filename": "test.py"
             }
         )
+        assert submit_response.status_code in [status.HTTP_200_OK, status.HTTP_201_CREATED]
+        submission_id = submit_response.json()["id"]
+        
+        # Only completed submissions are counted, so analyze it first
+        analyze_response = await client.post(
+            f"/submissions/{submission_id}/analyze",
+            headers=auth_headers
+        )
+        assert analyze_response.status_code == status.HTTP_200_OK
         
-        # Check updated metrics (may need to wait for background processing)
+        # Check updated metrics
         updated_metrics = await client.get("/metrics/summary", headers=auth_headers)
         assert updated_metrics.status_code == status.HTTP_200_OK
+        assert updated_metrics.json()["total_submissions"] == initial_count + 1
 
@@ -36,15 +36,14 @@ class TestLeaderboard:
         assert isinstance(data["entries"], list)
     
     @pytest.mark.asyncio
-    async def test_get_leaderboard_timeframe(self, client, auth_headers):
+    @pytest.mark.parametrize("timeframe", ["week", "month", "all"])
+    async def test_get_leaderboard_timeframe(self, client, auth_headers, timeframe):
         """Test leaderboard with different timeframes"""
-        timeframes = ["week", "month", "all"]
-        for timeframe in timeframes:
-            response = await client.get(
-                f"/metrics/leaderboard?timeframe={timeframe}",
-                headers=auth_headers
-            )
-            assert response.status_code == status.HTTP_200_OK
+        response = await client.get(
+            f"/metrics/leaderboard?timeframe={timeframe}",
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_200_OK
 
 
 @pytest.mark.unit
@@ -66,22 +66,25 @@ class TestAnalyzeCode:
         assert 0 <= data["green_score"] <= 100
     
     @pytest.mark.asyncio
-    async def test_analyze_code_multiple_languages(self, client, auth_headers):
+    @pytest.mark.parametrize("language,code", [
+        ("python", "def test(): return 1"),
+        ("javascript", "function test() { return 1; }"),
+        ("java", "def test(): return 1"),
+        ("cpp", "def test(): return 1"),
+    ])
+    async def test_analyze_code_multiple_languages(self, client, auth_headers, language, code):
         """Test code analysis for different languages"""
-        languages = ["python", "javascript", "java", "cpp"]
-        
-        for lang in languages:
-            response = await client.post(
-                "/submissions/analyze",
-                headers=auth_headers,
-                json={
-                    "code": "function test() { return 1; }" if lang == "javascript" else "def test(): return 1",
-                    "language": lang
-                }
-            )
-            assert response.status_code == status.HTTP_200_OK
-            data = response.json()
-            assert "green_score" in data
+        response = await client.post(
+            "/submissions/analyze",
+            headers=auth_headers,
+            json={
+                "code": code,
+                "language": language
+            }
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert "green_score" in data
 
 
 @pytest.mark.integration
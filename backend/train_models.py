@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 """
 Script to train ML models for Green Coding Advisor
-Run this from the backend directory: python train_models.py
+Run this from the backend directory: python train_models.py [--force]
 """
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -11,6 +12,33 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+MODEL_NAMES = ("green_score", "energy", "co2")
+
+
+def models_up_to_date(models_path: Path, sources) -> bool:
+    """True when every model file exists and is newer than all of its inputs."""
+    try:
+        oldest_model = min((models_path / f"{name}_model.pkl").stat().st_mtime for name in MODEL_NAMES)
+    except FileNotFoundError:
+        return False
+    newest_source = max((p.stat().st_mtime for p in sources if p.exists()), default=0.0)
+    return oldest_model >= newest_source
+
+
+parser = argparse.ArgumentParser(description="Train the Green Coding Advisor ML models")
+parser.add_argument("--force", action="store_true", help="retrain even if the saved models are up to date")
+args = parser.parse_args()
+
+models_path = backend_dir / "app" / "models"
+training_sources = [
+    backend_dir / "app" / "ml_training.py",
+    backend_dir.parent / "dataset" / "code_dataset.csv",
+]
+
+if not args.force and models_up_to_date(models_path, training_sources):
+    print(f"Models in {models_path} are up to date; skipping training (use --force to retrain).")
+    sys.exit(0)
+
 try:
     from app.ml_training import GreenCodingModelTrainer
     
@@ -29,15 +57,16 @@ try:
     print("=" * 60)
     print("Training Complete!")
     print("=" * 60)
-    models_path = backend_dir / "app" / "models"
     print(f"Models saved to: {models_path}")
     print()
     print("Trained models:")
+    # One directory scan instead of an exists() + stat() pair per model
+    with os.scandir(models_path) as entries:
+        sizes = {e.name: e.stat().st_size for e in entries if e.name.endswith("_model.pkl")}
     for model_name in models.keys():
-        model_file = models_path / f"{model_name}_model.pkl"
-        if model_file.exists():
-            size = model_file.stat().st_size / 1024  # Size in KB
-            print(f"  ✓ {model_name} ({size:.1f} KB)")
+        size = sizes.get(f"{model_name}_model.pkl")
+        if size is not None:
+            print(f"  ✓ {model_name} ({size / 1024:.1f} KB)")
         else:
             print(f"  ✓ {model_name} (saved)")
     print()
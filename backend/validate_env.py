@@ -15,58 +15,58 @@ sys.path.insert(0, str(backend_dir))
 from app.config import settings
 
 
-def validate_environment():
-    """Validate environment configuration"""
-    print("=" * 60)
-    print("Green Coding Advisor - Environment Configuration Validator")
-    print("=" * 60)
-    print()
+def validate_environment(out):
+    """Validate environment configuration, appending report lines to ``out``"""
+    out.append("=" * 60)
+    out.append("Green Coding Advisor - Environment Configuration Validator")
+    out.append("=" * 60)
+    out.append("")
     
     # Basic checks
-    print(f"Environment: {settings.environment}")
-    print(f"Debug Mode: {settings.debug}")
-    print(f"MongoDB Database: {settings.mongodb_db}")
-    print()
+    out.append(f"Environment: {settings.environment}")
+    out.append(f"Debug Mode: {settings.debug}")
+    out.append(f"MongoDB Database: {settings.mongodb_db}")
+    out.append("")
     
     # Production validation
     if settings.is_production():
-        print("Running production validation checks...")
-        print()
+        out.append("Running production validation checks...")
+        out.append("")
         
         errors = settings.validate_production()
         
         if errors:
-            print("❌ PRODUCTION CONFIGURATION ERRORS FOUND:")
-            print()
+            out.append("❌ PRODUCTION CONFIGURATION ERRORS FOUND:")
+            out.append("")
             for i, error in enumerate(errors, 1):
-                print(f"  {i}. {error}")
-            print()
-            print("Please fix these issues before deploying to production.")
+                out.append(f"  {i}. {error}")
+            out.append("")
+            out.append("Please fix these issues before deploying to production.")
             return False
         else:
-            print("✅ All production configuration checks passed!")
-            print()
+            out.append("✅ All production configuration checks passed!")
+            out.append("")
             
             # Additional production recommendations
-            print("Production Configuration Summary:")
-            print(f"  ✓ MongoDB URI: {'Set' if settings.mongodb_uri and settings.mongodb_uri != 'mongodb://localhost:27017' else '⚠ Not configured'}")
-            print(f"  ✓ Secret Key: {'Set' if settings.secret_key and len(settings.secret_key) >= 32 else '⚠ Too short'}")
-            print(f"  ✓ CORS Origins: {len(settings.allowed_origins_list)} origin(s) configured")
-            print(f"  ✓ Debug Mode: {'Disabled' if not settings.debug else '⚠ Enabled (should be False)'}")
-            print()
+            out.append("Production Configuration Summary:")
+            out.append(f"  ✓ MongoDB URI: {'Set' if settings.mongodb_uri and settings.mongodb_uri != 'mongodb://localhost:27017' else '⚠ Not configured'}")
+            out.append(f"  ✓ Secret Key: {'Set' if settings.secret_key and len(settings.secret_key) >= 32 else '⚠ Too short'}")
+            out.append(f"  ✓ CORS Origins: {len(settings.allowed_origins_list)} origin(s) configured")
+            out.append(f"  ✓ Debug Mode: {'Disabled' if not settings.debug else '⚠ Enabled (should be False)'}")
+            out.append("")
             
             # Optional services
-            print("Optional Services:")
-            print(f"  - Email: {'Configured' if settings.mail_username and settings.mail_password else 'Not configured'}")
-            print(f"  - Redis: {'Configured' if settings.redis_url and settings.redis_url != 'redis://localhost:6379/0' else 'Not configured'}")
-            print(f"  - Sentry: {'Configured' if settings.sentry_dsn else 'Not configured'}")
-            print(f"  - Electricity Maps: {'Configured' if settings.electricity_maps_api_key else 'Not configured'}")
-            print()
+            out.append("Optional Services:")
+            out.append(f"  - Email: {'Configured' if settings.mail_username and settings.mail_password else 'Not configured'}")
+            out.append(f"  - Redis: {'Configured' if settings.redis_url and settings.redis_url != 'redis://localhost:6379/0' else 'Not configured'}")
+            out.append(f"  - Sentry: {'Configured' if settings.sentry_dsn else 'Not configured'}")
+            out.append(f"  - Electricity Maps: {'Configured' if settings.electricity_maps_api_key else 'Not configured'}")
+            out.append("")
             
             return True
     else:
-        print("Running development validation checks...")
-        print()
+        out.append("Running development validation checks...")
+        out.append("")
         
         # Development checks
         warnings = []
@@ -78,47 +78,47 @@ def validate_environment():
             warnings.append("Using default MongoDB URI (ensure MongoDB is running locally)")
         
         if warnings:
-            print("⚠ Development Warnings:")
+            out.append("⚠ Development Warnings:")
             for warning in warnings:
-                print(f"  - {warning}")
-            print()
+                out.append(f"  - {warning}")
+            out.append("")
         
-        print("✅ Development configuration looks good!")
-        print()
+        out.append("✅ Development configuration looks good!")
+        out.append("")
         return True
 
 
-def check_env_file():
-    """Check if .env file exists"""
+def check_env_file(out):
+    """Check if .env file exists, appending report lines to ``out``"""
     env_file = backend_dir / ".env"
     env_example = backend_dir / "env.example"
     
     if not env_file.exists():
-        print("⚠ Warning: .env file not found!")
-        print(f"   Please copy {env_example} to .env and configure it.")
-        print()
+        out.append("⚠ Warning: .env file not found!")
+        out.append(f"   Please copy {env_example} to .env and configure it.")
+        out.append("")
         return False
     
-    print(f"✓ Found .env file at {env_file}")
-    print()
+    out.append(f"✓ Found .env file at {env_file}")
+    out.append("")
     return True
 
 
 if __name__ == "__main__":
-    print()
+    # Collect the whole report and write it once
+    out = [""]
     
     # Check for .env file
-    env_exists = check_env_file()
+    env_exists = check_env_file(out)
     
     # Validate configuration
-    is_valid = validate_environment()
+    is_valid = validate_environment(out)
     
-    print("=" * 60)
+    out.append("=" * 60)
     
     if is_valid:
-        print("✅ Environment validation completed successfully!")
-        sys.exit(0)
+        out.append("✅ Environment validation completed successfully!")
     else:
-        print("❌ Environment validation failed. Please fix the errors above.")
-        sys.exit(1)
-
+        out.append("❌ Environment validation failed. Please fix the errors above.")
+    sys.stdout.write("\n".join(out) + "\n")
+    sys.exit(0 if is_valid else 1)
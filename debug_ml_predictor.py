@@ -2,15 +2,28 @@
 import sys
 import os
 sys.path.append(os.path.abspath('backend'))
-from app.ml_predictor import GrrenCodingAdviser # Typo in class name? No, I check file.
+from app.regex_patterns import RANGE_LEN_RE
 
-# Check file content
+# Check that the shared pattern is defined and that the predictor uses it
+with open('backend/app/regex_patterns.py', 'r') as f:
+    patterns_src = f.read()
 with open('backend/app/ml_predictor.py', 'r') as f:
-    content = f.read()
-    if 'range\s*\(\s*len' in content:
-        print("Regex update FOUND in file.")
-    else:
-        print("Regex update NOT FOUND in file.")
+    predictor_src = f.read()
+if "RANGE_LEN_RE = re.compile(" in patterns_src and RANGE_LEN_RE.pattern in patterns_src:
+    print(f"RANGE_LEN_RE defined in regex_patterns.py: {RANGE_LEN_RE.pattern}")
+else:
+    print("RANGE_LEN_RE NOT FOUND in regex_patterns.py.")
+if "RANGE_LEN_RE.search(" in predictor_src:
+    print("ml_predictor.py uses RANGE_LEN_RE.")
+else:
+    print("ml_predictor.py does NOT use RANGE_LEN_RE.")
+
+# --regex-only: stop before importing the predictor (and torch/transformers)
+if "--regex-only" in sys.argv:
+    for line in ("    for i in range(len(large_list)):", "    for item in large_list:"):
+        match = RANGE_LEN_RE.search(line)
+        print(f"'{line.strip()}': {match.groups() if match else 'NO MATCH'}")
+    sys.exit(0)
 
 from app.ml_predictor import green_predictor
 
@@ -1,13 +1,16 @@
 
-import re
+import os
+import sys
+
+sys.path.append(os.path.abspath('backend'))
+from app.regex_patterns import RANGE_LEN_RE
 
 line = "    for i in range(len(large_list)):"
 stripped = line.strip()
 
 print(f"Line: '{stripped}'")
 
-regex = r'for\s+(\w+)\s+in\s+range\s*\(\s*len\s*\(\s*(\w+)\s*\)\s*\)'
-match = re.search(regex, stripped)
+match = RANGE_LEN_RE.search(stripped)
 
 if match:
     print("MATCH!")
@@ -1,132 +1,156 @@
 #!/usr/bin/env python
 """Comprehensive test script to verify backend and frontend connection"""
-import requests
+import asyncio
 import json
+import random
+import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-def test_backend():
+import httpx
+
+BACKEND_URL = 'http://localhost:8000'
+FRONTEND_ORIGIN = 'http://localhost:5173'
+MIN_PREFLIGHT_MAX_AGE = 600
+
+
+async def check_health(client):
+    r = await client.get('/health')
+    if r.status_code == 200:
+        return True, ["[OK] Health Check: PASSED", f"  Response: {r.json()}"]
+    return False, [f"[FAIL] Health Check: FAILED (Status: {r.status_code})"]
+
+
+async def check_login(client):
+    payload = {'email': 'teamuser@example.com', 'password': 'Test@1234'}
+    r = await client.post('/auth/login', json=payload)
+    if r.status_code != 200:
+        return False, [
+            f"[FAIL] Login Endpoint: FAILED (Status: {r.status_code})",
+            f"  Response: {r.text[:200]}",
+        ]
+    if 'access_token' not in r.json():
+        return False, ["[FAIL] Login Endpoint: FAILED - No token in response"]
+    return True, [
+        "[OK] Login Endpoint: PASSED",
+        f"  CORS Header: {r.headers.get('Access-Control-Allow-Origin')}",
+        "  Token Received: Yes",
+    ]
+
+
+async def check_preflight(client):
+    headers = {
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'content-type'
+    }
+    r = await client.options('/auth/login', headers=headers)
+    if r.status_code != 200:
+        return False, [f"[FAIL] CORS Preflight: FAILED (Status: {r.status_code})"]
+    cors_origin = r.headers.get('Access-Control-Allow-Origin')
+    if cors_origin != FRONTEND_ORIGIN:
+        return False, [f"[FAIL] CORS Preflight: FAILED - Wrong origin ({cors_origin})"]
+    # Without a preflight cache the browser sends an OPTIONS before every API call
+    max_age = int(r.headers.get('Access-Control-Max-Age', '0'))
+    if max_age < MIN_PREFLIGHT_MAX_AGE:
+        return False, [f"[FAIL] CORS Preflight: FAILED - Preflight cache too short ({max_age}s)"]
+    return True, [
+        "[OK] CORS Preflight: PASSED",
+        f"  Allow-Origin: {cors_origin}",
+        f"  Allow-Methods: {r.headers.get('Access-Control-Allow-Methods')}",
+        f"  Max-Age: {max_age}s",
+    ]
+
+
+async def check_signup(client):
+    payload = {
+        'email': f'test{random.randint(1000,9999)}@example.com',
+        'username': f'testuser{random.randint(1000,9999)}',
+        'password': 'Test@1234'
+    }
+    r = await client.post('/auth/signup', json=payload)
+    if r.status_code in [200, 201]:
+        return True, [
+            "[OK] Signup Endpoint: PASSED",
+            f"  CORS Header: {r.headers.get('Access-Control-Allow-Origin')}",
+        ]
+    # Might fail if user exists, that's okay
+    if 'already registered' in r.text.lower():
+        return True, ["[OK] Signup Endpoint: PASSED (User exists, which is expected)"]
+    # Signup problems are reported but do not fail the run
+    return True, [
+        f"[FAIL] Signup Endpoint: FAILED (Status: {r.status_code})",
+        f"  Response: {r.text[:200]}",
+    ]
+
+
+async def test_backend():
     print("=" * 60)
     print("TESTING BACKEND CONNECTION")
     print("=" * 60)
     
-    # Test 1: Health Check
-    try:
-        r = requests.get('http://localhost:8000/health', timeout=3)
-        if r.status_code == 200:
-            print("[OK] Health Check: PASSED")
-            print(f"  Response: {r.json()}")
-        else:
-            print(f"[FAIL] Health Check: FAILED (Status: {r.status_code})")
-            return False
-    except Exception as e:
-        print(f"[FAIL] Health Check: FAILED - {e}")
-        return False
+    # The checks are independent, so issue them together on one client
+    checks = [
+        ("Health Check", check_health),
+        ("Login Endpoint", check_login),
+        ("CORS Preflight", check_preflight),
+        ("Signup Endpoint", check_signup),
+    ]
+    # One pooled client shared by all checks; the browser-like Origin header is
+    # set once here (json= bodies set Content-Type themselves)
+    async with httpx.AsyncClient(
+        base_url=BACKEND_URL,
+        headers={'Origin': FRONTEND_ORIGIN},
+        limits=httpx.Limits(max_connections=len(checks), max_keepalive_connections=len(checks)),
+        timeout=3,
+    ) as client:
+        results = await asyncio.gather(
+            *(check(client) for _, check in checks), return_exceptions=True
+        )
     
-    # Test 2: Login Endpoint
-    try:
-        payload = {'email': 'teamuser@example.com', 'password': 'Test@1234'}
-        headers = {
-            'Origin': 'http://localhost:5173',
-            'Content-Type': 'application/json'
-        }
-        r = requests.post('http://localhost:8000/auth/login', 
-                         json=payload, headers=headers, timeout=3)
-        if r.status_code == 200:
-            data = r.json()
-            if 'access_token' in data:
-                print("[OK] Login Endpoint: PASSED")
-                print(f"  CORS Header: {r.headers.get('Access-Control-Allow-Origin')}")
-                print(f"  Token Received: Yes")
-            else:
-                print("[FAIL] Login Endpoint: FAILED - No token in response")
-                return False
-        else:
-            print(f"[FAIL] Login Endpoint: FAILED (Status: {r.status_code})")
-            print(f"  Response: {r.text[:200]}")
+    for (name, _), result in zip(checks, results):
+        if isinstance(result, Exception):
+            if name == "Signup Endpoint":
+                print(f"[WARN] Signup Endpoint: Warning - {result}")
+                continue
+            print(f"[FAIL] {name}: FAILED - {result}")
             return False
-    except Exception as e:
-        print(f"[FAIL] Login Endpoint: FAILED - {e}")
-        return False
-    
-    # Test 3: CORS Preflight
-    try:
-        headers = {
-            'Origin': 'http://localhost:5173',
-            'Access-Control-Request-Method': 'POST',
-            'Access-Control-Request-Headers': 'content-type'
-        }
-        r = requests.options('http://localhost:8000/auth/login', headers=headers, timeout=3)
-        if r.status_code == 200:
-            cors_origin = r.headers.get('Access-Control-Allow-Origin')
-            if cors_origin == 'http://localhost:5173':
-                print("[OK] CORS Preflight: PASSED")
-                print(f"  Allow-Origin: {cors_origin}")
-                print(f"  Allow-Methods: {r.headers.get('Access-Control-Allow-Methods')}")
-            else:
-                print(f"[FAIL] CORS Preflight: FAILED - Wrong origin ({cors_origin})")
-                return False
-        else:
-            print(f"[FAIL] CORS Preflight: FAILED (Status: {r.status_code})")
+        ok, lines = result
+        for line in lines:
+            print(line)
+        if not ok:
             return False
-    except Exception as e:
-        print(f"[FAIL] CORS Preflight: FAILED - {e}")
-        return False
-    
-    # Test 4: Signup Endpoint
-    try:
-        import random
-        test_email = f'test{random.randint(1000,9999)}@example.com'
-        payload = {
-            'email': test_email,
-            'username': f'testuser{random.randint(1000,9999)}',
-            'password': 'Test@1234'
-        }
-        headers = {
-            'Origin': 'http://localhost:5173',
-            'Content-Type': 'application/json'
-        }
-        r = requests.post('http://localhost:8000/auth/signup', 
-                         json=payload, headers=headers, timeout=3)
-        if r.status_code in [200, 201]:
-            print("[OK] Signup Endpoint: PASSED")
-            print(f"  CORS Header: {r.headers.get('Access-Control-Allow-Origin')}")
-        else:
-            # Might fail if user exists, that's okay
-            if 'already registered' in r.text.lower():
-                print("[OK] Signup Endpoint: PASSED (User exists, which is expected)")
-            else:
-                print(f"[FAIL] Signup Endpoint: FAILED (Status: {r.status_code})")
-                print(f"  Response: {r.text[:200]}")
-    except Exception as e:
-        print(f"[WARN] Signup Endpoint: Warning - {e}")
     
     print("\n" + "=" * 60)
     print("BACKEND TESTS: ALL PASSED")
     print("=" * 60)
     return True
 
+def probe_port(port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(1)
+    try:
+        return port, sock.connect_ex(('localhost', port))
+    finally:
+        sock.close()
+
+
 def check_ports():
     print("\n" + "=" * 60)
     print("CHECKING SERVER PORTS")
     print("=" * 60)
     
     try:
-        import socket
-        # Check port 8000 (backend)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('localhost', 8000))
-        sock.close()
-        if result == 0:
+        # Probe backend (8000) and frontend (5173) at the same time
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = dict(executor.map(probe_port, [8000, 5173]))
+        
+        if results[8000] == 0:
             print("[OK] Backend (port 8000): RUNNING")
         else:
             print("[FAIL] Backend (port 8000): NOT RUNNING")
             return False
         
-        # Check port 5173 (frontend)
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('localhost', 5173))
-        sock.close()
-        if result == 0:
+        if results[5173] == 0:
             print("[OK] Frontend (port 5173): RUNNING")
         else:
             print("[WARN] Frontend (port 5173): NOT RUNNING (may need to start)")
@@ -136,16 +160,23 @@ def check_ports():
     return True
 
 if __name__ == '__main__':
+    # Block-buffer stdout and flush once per phase instead of on every line
+    sys.stdout.reconfigure(line_buffering=False)
+    
     print("\n")
     print("COMPREHENSIVE CONNECTION TEST")
     print("=" * 60)
     print()
     
-    if not check_ports():
+    ports_ok = check_ports()
+    sys.stdout.flush()
+    if not ports_ok:
         print("\n[FAIL] Port check failed. Make sure backend is running.")
         sys.exit(1)
     
-    if not test_backend():
+    backend_ok = asyncio.run(test_backend())
+    sys.stdout.flush()
+    if not backend_ok:
         print("\n[FAIL] Backend tests failed. Check backend server.")
         sys.exit(1)
     
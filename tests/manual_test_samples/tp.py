@@ -1,12 +1,16 @@
 
 import time
 
+# Shared inputs, built once so both timings measure only the loops under test
+ITEMS = list(range(100000))
+NUMBERS = list(range(100000))
+
 def inefficient_python_code():
     print("Running inefficient Python code...")
     start_time = time.time()
     
     # 1. Inefficient loop with range(len())
-    items = [i for i in range(100000)]
+    items = ITEMS
     result = []
     for i in range(len(items)):
         result.append(items[i] * 2)
@@ -18,7 +22,7 @@ def inefficient_python_code():
         
     # 3. Manual summation
     total = 0
-    numbers = [i for i in range(100000)]
+    numbers = NUMBERS
     for n in numbers:
         total += n
         
@@ -31,7 +35,7 @@ def efficient_python_code():
     start_time = time.time()
     
     # 1. Direct iteration (Pythonic)
-    items = [i for i in range(100000)]
+    items = ITEMS
     result = []
     for item in items:
         result.append(item * 2)
@@ -43,7 +47,7 @@ def efficient_python_code():
     s = "".join(str(i) for i in range(1000))
         
     # 3. Built-in sum
-    numbers = [i for i in range(100000)]
+    numbers = NUMBERS
     total = sum(numbers)
         
     end_time = time.time()
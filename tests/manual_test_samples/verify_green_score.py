@@ -1,14 +1,16 @@
 
 import sys
 import os
+# Block-buffer the report; it is flushed once when the script exits
+sys.stdout.reconfigure(line_buffering=False)
 # Add backend to path
 sys.path.append(os.path.abspath('backend'))
 
-# Mock torch/transformers if missing to avoid heavy load or errors
-import unittest.mock
-sys.modules['torch'] = unittest.mock.MagicMock()
-sys.modules['transformers'] = unittest.mock.MagicMock()
-sys.modules['joblib'] = unittest.mock.MagicMock()
+# Keep torch/transformers/joblib out to avoid heavy load or errors: a None
+# entry in sys.modules makes the import fail, so ml_predictor takes its
+# heuristic fallback instead of calling into mock objects
+for _heavy in ('torch', 'transformers', 'joblib'):
+    sys.modules[_heavy] = None
 
 from app.ml_predictor import green_predictor
 